@@ -20,12 +20,20 @@ The composite score is the arithmetic mean of these five sensory scores.
 
 import json
 import logging
-from typing import Optional, TypedDict
+import math
+from collections.abc import Iterable
+from typing import Callable, Optional, TypedDict, Union
 
 import numpy as np
 
-# Configure logging to track function calls and errors
-logging.basicConfig(level=logging.INFO)
+try:
+    import numba
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is an optional dependency; fall back to pure NumPy
+    _HAS_NUMBA = False
+
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 
@@ -34,57 +42,333 @@ class RatingsData(TypedDict, total=False):
     """
     TypedDict to define the structure of input ratings and feedback data.
 
+    Every metric may be given as a list or as a 1-D NumPy array. Arrays of dtype float64
+    (bool for application_successes) skip the element-wise conversion of lists, but the
+    rated metrics are still copied into one padded array; compute_senses_batch accepts
+    data that is already stacked.
+
     Attributes:
-        coherence_ratings (list[float]): Scores for response coherence (0-1).
-        structural_feedback (list[float]): Scores for structural clarity (0-1).
-        novelty_indicators (list[float]): Deviation scores for novelty (e.g., z-scores).
-        application_successes (list[bool]): Boolean indicators of successful applications.
-        likability_scores (list[float]): Subjective ratings (1-5).
+        coherence_ratings (list[float] | np.ndarray): Scores for response coherence (0-1).
+        structural_feedback (list[float] | np.ndarray): Scores for structural clarity (0-1).
+        novelty_indicators (list[float] | np.ndarray): Deviation scores for novelty
+            (e.g., z-scores).
+        application_successes (list[bool] | np.ndarray): Boolean indicators of successful
+            applications.
+        likability_scores (list[float] | np.ndarray): Subjective ratings (1-5).
         custom_metric (Optional[list[float]]): Placeholder for additional custom metrics.
     """
 
-    coherence_ratings: list[float]
-    structural_feedback: list[float]
-    novelty_indicators: list[float]
-    application_successes: list[bool]
-    likability_scores: list[float]
+    coherence_ratings: Union[list[float], np.ndarray]
+    structural_feedback: Union[list[float], np.ndarray]
+    novelty_indicators: Union[list[float], np.ndarray]
+    application_successes: Union[list[bool], np.ndarray]
+    likability_scores: Union[list[float], np.ndarray]
     custom_metric: Optional[list[float]]
 
 
-def remove_outliers(data_list: list[float], threshold: float = 3.0) -> list[float]:
+# Keys that every RatingsData passed to compute_senses must provide
+_REQUIRED_KEYS = frozenset(
+    {
+        "coherence_ratings",
+        "structural_feedback",
+        "novelty_indicators",
+        "application_successes",
+        "likability_scores",
+    }
+)
+
+# Precomputed serialization of the fixed-schema SENSES metadata. "%r" formats floats with
+# repr(), which matches what json.dumps emits for finite floats only; non-finite scores
+# fall back to json.dumps, which writes Infinity and NaN.
+_METADATA_KEYS = ("hear", "see", "smell", "touch", "taste")
+_METADATA_TEMPLATE = '{"hear": %r, "see": %r, "smell": %r, "touch": %r, "taste": %r}'
+
+# Result of compute_senses when every input list is empty
+_EMPTY_RESULT = (_METADATA_TEMPLATE % ((0.0,) * 5), 0.0)
+
+# Valid [low, high] range of each row of the array stacked for the fused sensory kernel:
+# coherence, structural feedback, novelty and likability. Rows with a finite range are
+# rescaled to [0, 1]; the unbounded novelty row is normalized by its largest absolute
+# deviation instead.
+_STACKED_LOW = np.array([0.0, 0.0, -np.inf, 1.0])
+_STACKED_HIGH = np.array([1.0, 1.0, np.inf, 5.0])
+
+# Valid [low, high] range of each row of a compute_senses_batch prompt, in HSSTT order:
+# coherence, structural feedback, novelty, application successes and likability. The
+# successes row is averaged directly, without outlier removal.
+_BATCH_LOW = np.array([0.0, 0.0, -np.inf, 0.0, 1.0])
+_BATCH_HIGH = np.array([1.0, 1.0, np.inf, 1.0, 5.0])
+_BATCH_TOUCH_ROW = 3
+
+
+def _nan_median(data_arr: np.ndarray, n_valid: int) -> float:
+    """
+    Median of the non-NaN values of a 1-D array holding n_valid of them.
+
+    Calls np.partition directly, skipping the NaN scan and axis handling of np.nanmedian.
+    NaN values are ordered last by both np.sort and np.partition, so the valid values
+    occupy the first n_valid positions of the result.
+    """
+    k = n_valid // 2
+    if n_valid <= 16:
+        # Partitioning does not pay off over a plain sort for tiny arrays
+        ordered = np.sort(data_arr)
+    elif n_valid & 1:
+        ordered = np.partition(data_arr, k)
+    else:
+        ordered = np.partition(data_arr, [k - 1, k])
+
+    if n_valid & 1:
+        return float(ordered[k])
+    # Halve before adding so that the midpoint of values near the float64 limit is finite
+    return 0.5 * ordered[k - 1] + 0.5 * ordered[k]
+
+
+def _filter_outliers_numpy(data_arr: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    NumPy implementation behind remove_outliers for arrays with at least one non-NaN value.
+    """
+    n_valid = data_arr.size - int(np.count_nonzero(np.isnan(data_arr)))
+    median = _nan_median(data_arr, n_valid)
+    # Take the absolute value in place so only one temporary is allocated
+    with np.errstate(invalid="ignore"):
+        deviations = data_arr - median
+    np.abs(deviations, out=deviations)
+
+    # Recount: an infinite median turns infinite values into NaN deviations (inf - inf).
+    # Without any valid deviation the MAD is NaN, as np.nanmedian would give, and every
+    # value is dropped.
+    n_deviations = deviations.size - int(np.count_nonzero(np.isnan(deviations)))
+    mad = _nan_median(deviations, n_deviations) if n_deviations > 0 else np.nan
+
+    # If the MAD is zero, at least half of the values are identical; no outliers
+    limit = threshold * 1.4826 * mad if mad != 0 else np.inf
+
+    # Keep values whose modified Z-score is within the threshold; 1.4826 scales the MAD
+    # to be a consistent estimator of the standard deviation for normal data. NaN
+    # deviations never compare true, so missing values are dropped as well.
+    keep = deviations <= limit
+
+    # In the common case nothing is dropped; return the input itself instead of a copy
+    if keep.all():
+        return data_arr
+    return data_arr[keep]
+
+
+def _mask_range_numpy(row: np.ndarray, low: float, high: float) -> np.ndarray:
+    """
+    NumPy implementation of _mask_range: a copy of row with out-of-range values as NaN.
+    """
+    # np.where marks the invalid values without compacting the row into a shorter array
+    return np.where((row < low) | (row > high), np.nan, row)
+
+
+_mask_range: Callable[[np.ndarray, float, float], np.ndarray]
+_filter_outliers: Callable[[np.ndarray, float], np.ndarray]
+prange: Callable[[int], Iterable[int]]
+
+if _HAS_NUMBA:
+
+    @numba.njit(cache=True)
+    def _filter_outliers_numba(data_arr: np.ndarray, threshold: float) -> np.ndarray:
+        """
+        Compiled implementation behind remove_outliers for arrays with a non-NaN value.
+
+        Computes the median and MAD, then copies the retained values into a single
+        buffer, avoiding the temporaries of the NumPy implementation. The input itself is
+        returned when nothing is dropped.
+        """
+        n = data_arr.size
+        median = np.nanmedian(data_arr)
+        deviations = np.empty(n)
+        for i in range(n):
+            deviations[i] = abs(data_arr[i] - median)
+        mad = np.nanmedian(deviations)
+
+        # If the MAD is zero, at least half of the values are identical; no outliers
+        limit = threshold * 1.4826 * mad if mad != 0 else np.inf
+
+        count = 0
+        for i in range(n):
+            if deviations[i] <= limit:
+                count += 1
+        if count == n:
+            return data_arr
+
+        out = np.empty(count, dtype=data_arr.dtype)
+        j = 0
+        for i in range(n):
+            if deviations[i] <= limit:
+                out[j] = data_arr[i]
+                j += 1
+        return out
+
+    @numba.njit(cache=True)
+    def _mask_range_numba(row: np.ndarray, low: float, high: float) -> np.ndarray:
+        """
+        Compiled implementation of _mask_range.
+
+        Checks both bounds of every value in a single pass, without building separate
+        comparison and mask arrays.
+        """
+        out = np.empty_like(row)
+        for i in range(row.size):
+            value = row[i]
+            out[i] = np.nan if value < low or value > high else value
+        return out
+
+    _mask_range = _mask_range_numba
+    _filter_outliers = _filter_outliers_numba
+    prange = numba.prange
+else:
+    _mask_range = _mask_range_numpy
+    _filter_outliers = _filter_outliers_numpy
+    prange = range
+
+
+def _filter_mean(row: np.ndarray, low: float, high: float, threshold: float) -> float:
+    """
+    Computes the normalized score of a single metric.
+
+    Values outside [low, high] are marked as NaN, the row is stripped of outliers and its
+    mean is normalized to [0, 1]: metrics with a finite [low, high] range are rescaled
+    from that range, while an unbounded metric is normalized by its largest absolute
+    value. When Numba is installed this function is compiled.
+
+    Args:
+        row (np.ndarray): 1-D array of values, NaN marking padding. It is not modified.
+        low (float): Lower bound of the valid range of the metric.
+        high (float): Upper bound of the valid range of the metric.
+        threshold (float): Modified Z-score threshold for outlier removal.
+
+    Returns:
+        float: Normalized score, 0.0 if the row has no valid values.
+    """
+    row = _mask_range(row, low, high)
+    if np.isnan(row).all():
+        return 0.0
+
+    clean = _filter_outliers(row, threshold)
+    if clean.size == 0:
+        # Non-finite values can leave no usable median or MAD, dropping every value
+        return 0.0
+
+    if np.isfinite(high):
+        # Rescale the mean from the valid range to [0, 1]
+        return (np.mean(clean) - low) / (high - low)
+
+    # Normalize the absolute values by the maximum absolute value before averaging, so the
+    # sum stays within [0, n] even for scores near the float64 limit
+    clean_abs = np.abs(clean)
+    max_abs = np.max(clean_abs)
+    return np.mean(clean_abs / max_abs) if max_abs > 0 else 0.0
+
+
+def _compute_all_senses(
+    stacked: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
     """
-    Removes outliers from a list of numerical values using the Z-score method.
+    Computes the normalized score of every row of a 2-D array of metrics.
 
-    The Z-score measures how many standard deviations a value is from the mean.
-    Values with a Z-score beyond the threshold are considered outliers and removed.
+    Padding must be set to NaN; each row is scored by _filter_mean with its own range.
+    When Numba is installed this function is compiled. It runs serially: with only four
+    short rows, thread dispatch gains nothing, and a parallel kernel would not be safe to
+    call from several Python threads under numba's default workqueue threading layer.
 
     Args:
-        data_list (List[float]): List of numerical values.
-        threshold (float): Z-score threshold for outlier detection. Defaults to 3.0.
+        stacked (np.ndarray): 2-D array with one metric per row, NaN marking missing values.
+        low (np.ndarray): Lower bound of the valid range of each row.
+        high (np.ndarray): Upper bound of the valid range of each row.
+        threshold (float): Modified Z-score threshold for outlier removal.
 
     Returns:
-        List[float]: List with outliers removed.
+        np.ndarray: Score of each row, 0.0 for rows without valid values.
     """
-    if len(data_list) < 2:
-        # If the list has fewer than 2 elements, outliers cannot be meaningfully detected
-        return data_list
+    scores = np.zeros(stacked.shape[0])
+    for i in range(stacked.shape[0]):
+        scores[i] = _filter_mean(stacked[i], low[i], high[i], threshold)
+    return scores
 
-    # Convert the list to a NumPy array for vectorized operations
-    data_arr = np.array(data_list)
-    mean, std = np.mean(data_arr), np.std(data_arr)
 
-    # If the standard deviation is zero, all values are identical; no outliers
-    if std == 0:
-        return data_list
+def _success_rate(row: np.ndarray) -> float:
+    """
+    Computes the proportion of successes in a row of 1.0/0.0 values padded with NaN.
+    """
+    n_valid = row.size - np.count_nonzero(np.isnan(row))
+    return np.nansum(row) / n_valid if n_valid > 0 else 0.0
 
-    # Calculate Z-scores for all values
-    z_scores = np.abs((data_arr - mean) / (std + 1e-9))  # Add small value to avoid division by zero
 
-    # Filter out values with Z-scores beyond the threshold
-    return data_arr[z_scores <= threshold].tolist()
+def _compute_senses_batch(
+    batched: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    threshold: float,
+    out: np.ndarray,
+) -> None:
+    """
+    Writes the SENSES scores and composite score of every prompt of a batch into out.
 
+    Padding must be set to NaN. When Numba is installed this function is compiled and the
+    prompts are processed in parallel.
 
-def compute_senses(ratings_data: RatingsData, z_threshold: float = 3.0) -> tuple[str, float]:
+    Args:
+        batched (np.ndarray): 3-D array of shape (B, 5, N), rows in HSSTT order.
+        low (np.ndarray): Lower bound of the valid range of each row.
+        high (np.ndarray): Upper bound of the valid range of each row.
+        threshold (float): Modified Z-score threshold for outlier removal.
+        out (np.ndarray): Array of shape (B, 6) receiving the five scores and composite.
+    """
+    for b in prange(batched.shape[0]):
+        prompt = batched[b]
+        total = 0.0
+        for j in range(5):
+            if j == _BATCH_TOUCH_ROW:
+                score = _success_rate(prompt[j])
+            else:
+                score = _filter_mean(prompt[j], low[j], high[j], threshold)
+            out[b, j] = score
+            total += score
+        out[b, 5] = total / 5
+
+
+if _HAS_NUMBA:
+    _filter_mean = numba.njit(cache=True)(_filter_mean)
+    _compute_all_senses = numba.njit(cache=True)(_compute_all_senses)
+    _success_rate = numba.njit(cache=True)(_success_rate)
+    _compute_senses_batch = numba.njit(parallel=True, cache=True)(_compute_senses_batch)
+
+
+def remove_outliers(data_arr: np.ndarray, threshold: float = 3.5) -> np.ndarray:
+    """
+    Removes outliers from an array of numerical values using the modified Z-score method.
+
+    The modified Z-score measures how far a value is from the median in units of the
+    median absolute deviation (MAD). Unlike the mean and standard deviation, the median
+    and MAD are not dragged towards the outliers they are meant to detect, so a single
+    pass is enough even when the data contains extreme values.
+
+    Args:
+        data_arr (np.ndarray): 1-D array of numerical values.
+        threshold (float): Modified Z-score threshold for outlier detection. Defaults to 3.5.
+
+    Returns:
+        np.ndarray: Array with outliers removed, or the input array itself when no value
+        is dropped. NaN values are treated as missing: they are ignored when estimating
+        the median and MAD and are not returned.
+    """
+    # No copy is made when the input is already a float64 array
+    data_arr = np.asarray(data_arr, dtype=np.float64)
+    if data_arr.size < 2 or np.isnan(data_arr).all():
+        # With fewer than 2 elements or no valid values, outliers cannot be detected
+        return data_arr
+
+    return _filter_outliers(data_arr, threshold)
+
+
+def compute_senses(ratings_data: RatingsData, z_threshold: float = 3.5) -> tuple[str, float]:
     """
     Computes the SENSES (HSSTT) scores from user ratings and feedback.
 
@@ -93,7 +377,8 @@ def compute_senses(ratings_data: RatingsData, z_threshold: float = 3.0) -> tuple
 
     Args:
         ratings_data (RatingsData): Dictionary of user-provided metrics.
-        z_threshold (float): Custom Z-score threshold for outlier removal. Defaults to 3.0.
+        z_threshold (float): Custom modified Z-score threshold for outlier removal.
+            Defaults to 3.5.
 
     Returns:
         Tuple[str, float]:
@@ -103,96 +388,152 @@ def compute_senses(ratings_data: RatingsData, z_threshold: float = 3.0) -> tuple
     Raises:
         RuntimeError: If input validation fails or unexpected errors occur.
     """
-    logger.info("Starting SENSES computation with Z-threshold: %s", z_threshold)
+    logger.debug("Starting SENSES computation with Z-threshold: %s", z_threshold)
 
     try:
         # --- Input Validation ---
         if not isinstance(ratings_data, dict):
             raise ValueError("ratings_data must be a dictionary")
 
-        # Check for missing required keys
-        required_keys = [
-            "coherence_ratings",
-            "structural_feedback",
-            "novelty_indicators",
-            "application_successes",
-            "likability_scores",
-        ]
-        missing_keys = [key for key in required_keys if key not in ratings_data]
+        # Check for missing required keys with a single set difference on the dict keys
+        missing_keys = _REQUIRED_KEYS - ratings_data.keys()
         if missing_keys:
-            raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
+            raise ValueError(f"Missing required keys: {', '.join(sorted(missing_keys))}")
+
+        # Without any data every score is 0.0; skip the computation entirely
+        if not (
+            len(ratings_data["coherence_ratings"])
+            or len(ratings_data["structural_feedback"])
+            or len(ratings_data["novelty_indicators"])
+            or len(ratings_data["application_successes"])
+            or len(ratings_data["likability_scores"])
+        ):
+            return _EMPTY_RESULT
+
+        # --- Hear, See, Smell, Taste ---
+        # Pad the four rated metrics into one (4, max_len) array so that range filtering,
+        # outlier removal and normalization happen in a single fused pass. The array stays
+        # float64: downcasting before the range check would change which ratings are valid,
+        # and unbounded novelty scores can overflow float32.
+        rows = [
+            np.asarray(ratings_data["coherence_ratings"], dtype=np.float64),
+            np.asarray(ratings_data["structural_feedback"], dtype=np.float64),
+            np.asarray(ratings_data["novelty_indicators"], dtype=np.float64),
+            np.asarray(ratings_data["likability_scores"], dtype=np.float64),
+        ]
+        stacked = np.full((len(rows), max(row.size for row in rows)), np.nan)
+        for i, row in enumerate(rows):
+            stacked[i, : row.size] = row
 
-        # --- Hear: Coherence ---
-        # Convert to NumPy array and filter invalid values outside [0, 1]
-        coherence_arr = np.array(ratings_data["coherence_ratings"], dtype=float)
-        coherence_filtered = coherence_arr[(coherence_arr >= 0) & (coherence_arr <= 1)].tolist()
+        scores = _compute_all_senses(stacked, _STACKED_LOW, _STACKED_HIGH, z_threshold)
+        hear, see, smell, taste = (float(score) for score in scores)
 
-        # Remove outliers and compute the mean
-        coherence_clean = remove_outliers(coherence_filtered, z_threshold)
-        hear = float(np.mean(coherence_clean)) if len(coherence_clean) else 0.0
+        # --- Touch: Success Rate ---
+        successes = np.asarray(ratings_data["application_successes"])
 
-        # --- See: Structural Feedback ---
-        structural_arr = np.array(ratings_data["structural_feedback"], dtype=float)
-        structural_filtered = structural_arr[(structural_arr >= 0) & (structural_arr <= 1)].tolist()
+        # Validate that all values are boolean; NumPy only infers a bool dtype when every
+        # element is a bool, so a single dtype check replaces a per-element isinstance loop
+        if successes.size > 0 and successes.dtype != np.bool_:
+            raise ValueError("application_successes must contain booleans")
 
-        # Remove outliers and compute the mean
-        structural_clean = remove_outliers(structural_filtered, z_threshold)
-        see = float(np.mean(structural_clean)) if len(structural_clean) else 0.0
+        # Compute the proportion of successful applications; count_nonzero on a bool array
+        # is a single byte-counting pass with no float accumulation
+        touch = float(np.count_nonzero(successes)) / successes.size if successes.size > 0 else 0.0
 
-        # --- Smell: Novelty ---
-        novelty = np.array(ratings_data["novelty_indicators"], dtype=float)
+        # --- Composite Score ---
+        # Compute the arithmetic mean of all SENSES scores; plain float arithmetic avoids
+        # building a NumPy array for five values
+        composite_score = (hear + see + smell + touch + taste) / 5
 
-        # Remove outliers and compute the mean of absolute values
-        novelty_clean = remove_outliers(novelty.tolist(), z_threshold)
-        novelty_abs = np.abs(novelty_clean)
+        # --- Serialize Metadata ---
+        # Round scores to two decimal places and serialize as JSON
+        rounded_scores = (
+            round(hear, 2),
+            round(see, 2),
+            round(smell, 2),
+            round(touch, 2),
+            round(taste, 2),
+        )
+        # Any non-finite score makes the composite non-finite, so one check covers all five
+        if math.isfinite(composite_score):
+            serialized_metadata = _METADATA_TEMPLATE % rounded_scores
+        else:
+            serialized_metadata = json.dumps(dict(zip(_METADATA_KEYS, rounded_scores)))
+
+        logger.debug("SENSES computation completed. Composite score: %s", composite_score)
+        return serialized_metadata, composite_score
 
-        # Normalize the mean to [0, 1] by dividing by the maximum absolute value
-        max_abs = np.max(novelty_abs) if len(novelty_abs) and np.any(novelty_abs > 0) else 1.0
-        smell = float(np.mean(novelty_abs) / max_abs) if len(novelty_abs) else 0.0
+    except (ValueError, TypeError) as e:
+        # Log and re-raise input validation errors
+        logger.error("Input validation error: %s", str(e))
+        raise RuntimeError(f"Error processing ratings_data: {str(e)}") from e
+    except Exception as e:
+        # Log and re-raise unexpected errors
+        logger.error("Unexpected error: %s", str(e))
+        raise RuntimeError(f"Unexpected error: {str(e)}") from e
 
-        # --- Touch: Success Rate ---
-        successes = ratings_data["application_successes"]
 
-        # Validate that all values are boolean
-        if not all(isinstance(x, bool) for x in successes):
-            raise ValueError("application_successes must contain booleans")
+def compute_senses_batch(
+    batched: np.ndarray, out: Optional[np.ndarray] = None, z_threshold: float = 3.5
+) -> np.ndarray:
+    """
+    Computes the SENSES (HSSTT) scores of many prompts in a single call.
 
-        # Compute the proportion of successful applications
-        touch = sum(successes) / len(successes) if successes else 0.0
+    Unlike compute_senses, no dictionary or JSON string is built per prompt: the scores
+    of the whole batch are written into one array, optionally preallocated by the
+    caller. Callers that need JSON can serialize the batch at the end.
 
-        # --- Taste: Likability ---
-        likability_arr = np.array(ratings_data["likability_scores"], dtype=float)
+    With Numba installed the prompts are processed in parallel. Calling this function
+    from several Python threads then requires a thread-safe Numba threading layer (tbb or
+    omp): the workqueue layer, Numba's fallback when neither is installed, aborts the
+    process on concurrent use. The fast extra installs tbb where wheels are available.
 
-        # Filter invalid values outside [1, 5]
-        likability_filtered = likability_arr[(likability_arr >= 1) & (likability_arr <= 5)].tolist()
+    Args:
+        batched (np.ndarray): Array of shape (B, 5, N) holding the data of B prompts.
+            The rows of each prompt are, in HSSTT order, the coherence ratings, structural
+            feedback, novelty indicators, application successes (1.0 or 0.0) and
+            likability scores, each padded to length N with NaN.
+        out (Optional[np.ndarray]): Floating-point array of shape (B, 6) to write the results
+            into.
+            A new array is allocated when omitted.
+        z_threshold (float): Custom modified Z-score threshold for outlier removal.
+            Defaults to 3.5.
 
-        # Remove outliers and normalize the mean to [0, 1]
-        likability_clean = remove_outliers(likability_filtered, z_threshold)
-        taste = float((np.mean(likability_clean) - 1) / 4) if len(likability_clean) else 0.0
+    Returns:
+        np.ndarray: The array of shape (B, 6) holding, for each prompt, the hear, see,
+        smell, touch and taste scores followed by the composite score.
 
-        # --- Composite Score ---
-        # Compute the arithmetic mean of all SENSES scores
-        hsstt_values = [hear, see, smell, touch, taste]
-        composite_score = float(np.mean(hsstt_values))
+    Raises:
+        RuntimeError: If input validation fails or unexpected errors occur.
+    """
+    logger.debug("Starting batched SENSES computation with Z-threshold: %s", z_threshold)
 
-        # --- Serialize Metadata ---
-        # Round scores to two decimal places and serialize as JSON
-        senses_metadata = {
-            "hear": round(hear, 2),
-            "see": round(see, 2),
-            "smell": round(smell, 2),
-            "touch": round(touch, 2),
-            "taste": round(taste, 2),
-        }
-        serialized_metadata = json.dumps(senses_metadata)
-
-        logger.info("SENSES computation completed. Composite score: %s", composite_score)
-        return serialized_metadata, composite_score
+    try:
+        # --- Input Validation ---
+        batched = np.asarray(batched, dtype=np.float64)
+        if batched.ndim != 3 or batched.shape[1] != 5:
+            raise ValueError("batched must have shape (B, 5, N)")
+
+        successes = batched[:, _BATCH_TOUCH_ROW]
+        if not np.all(np.isnan(successes) | (successes == 0) | (successes == 1)):
+            raise ValueError("application successes must be 1.0, 0.0 or NaN padding")
+
+        if out is None:
+            out = np.empty((batched.shape[0], 6))
+        elif out.shape != (batched.shape[0], 6):
+            raise ValueError(f"out must have shape ({batched.shape[0]}, 6)")
+        elif not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("out must have a floating-point dtype")
+
+        _compute_senses_batch(batched, _BATCH_LOW, _BATCH_HIGH, z_threshold, out)
+
+        logger.debug("Batched SENSES computation completed for %s prompts", out.shape[0])
+        return out
 
     except (ValueError, TypeError) as e:
         # Log and re-raise input validation errors
         logger.error("Input validation error: %s", str(e))
-        raise RuntimeError(f"Error processing ratings_data: {str(e)}") from e
+        raise RuntimeError(f"Error processing batched ratings: {str(e)}") from e
     except Exception as e:
         # Log and re-raise unexpected errors
         logger.error("Unexpected error: %s", str(e))
@@ -3,8 +3,13 @@
 
 import json
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from senses import compute_senses
+import numpy as np
+
+import senses
+from senses import compute_senses, compute_senses_batch, remove_outliers
 
 
 class TestComputeSenses(unittest.TestCase):
@@ -24,6 +29,7 @@ class TestComputeSenses(unittest.TestCase):
             json.loads(metadata),
             {"hear": 0.8, "see": 0.83, "smell": 0.56, "touch": 0.67, "taste": 0.86},
         )
+        self.assertEqual(metadata, json.dumps(json.loads(metadata)))
 
     def test_empty_lists(self):
         data = {
@@ -63,6 +69,195 @@ class TestComputeSenses(unittest.TestCase):
         metadata, composite = compute_senses(data, z_threshold=1.5)
         self.assertAlmostEqual(json.loads(metadata)["hear"], 0.85, places=2)
 
+    def test_ndarray_inputs(self):
+        expected = compute_senses(self.sample_data)
+        data = {
+            key: np.asarray(values, dtype=bool if key == "application_successes" else float)
+            for key, values in self.sample_data.items()
+        }
+        self.assertEqual(compute_senses(data), expected)
+
+    def test_missing_keys(self):
+        data = dict(self.sample_data)
+        del data["likability_scores"], data["coherence_ratings"]
+        with self.assertRaisesRegex(RuntimeError, "coherence_ratings, likability_scores"):
+            compute_senses(data)
+
+    def test_non_boolean_successes(self):
+        data = dict(self.sample_data, application_successes=[True, 1, False])
+        with self.assertRaises(RuntimeError):
+            compute_senses(data)
+
+    def test_concurrent_calls(self):
+        expected = compute_senses(self.sample_data)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(compute_senses, [self.sample_data] * 64))
+        self.assertEqual(results, [expected] * 64)
+
+    def compute_senses_numpy(self, data):
+        # Numba-compiled functions keep the original Python function as py_func
+        kernel = getattr(senses._compute_all_senses, "py_func", senses._compute_all_senses)
+        row_score = getattr(senses._filter_mean, "py_func", senses._filter_mean)
+        with mock.patch.object(senses, "_compute_all_senses", kernel):
+            with mock.patch.object(senses, "_filter_mean", row_score):
+                with mock.patch.object(senses, "_filter_outliers", senses._filter_outliers_numpy):
+                    with mock.patch.object(senses, "_mask_range", senses._mask_range_numpy):
+                        return compute_senses(data)
+
+    def test_numpy_fallback_matches(self):
+        expected = compute_senses(self.sample_data)
+        metadata, composite = self.compute_senses_numpy(self.sample_data)
+        self.assertEqual(metadata, expected[0])
+        self.assertAlmostEqual(composite, expected[1])
+
+    def test_range_boundaries_use_input_precision(self):
+        data = dict(self.sample_data, coherence_ratings=[1 + 1e-9], novelty_indicators=[1e39])
+        metadata, _ = compute_senses(data)
+        self.assertEqual(json.loads(metadata)["hear"], 0.0)
+        self.assertEqual(json.loads(metadata)["smell"], 1.0)
+
+    def test_huge_novelty(self):
+        data = dict(self.sample_data, novelty_indicators=[1e308, 1e308])
+        for compute in (compute_senses, self.compute_senses_numpy):
+            metadata, composite = compute(data)
+            self.assertEqual(json.loads(metadata)["smell"], 1.0)
+            self.assertTrue(np.isfinite(composite))
+
+    def test_non_finite_scores_stay_valid_json(self):
+        scores = np.array([float("inf"), 0.0, float("nan"), 0.0])
+        with mock.patch.object(senses, "_compute_all_senses", return_value=scores):
+            metadata, _ = compute_senses(self.sample_data)
+        parsed = json.loads(metadata)
+        self.assertEqual(parsed["hear"], float("inf"))
+        self.assertTrue(np.isnan(parsed["smell"]))
+
+    def test_infinite_novelty(self):
+        expected = {"hear": 0.8, "see": 0.83, "smell": 0.0, "touch": 0.67, "taste": 0.86}
+        for novelty in ([float("inf")], [float("inf"), float("inf")]):
+            data = dict(self.sample_data, novelty_indicators=novelty)
+            for compute in (compute_senses, self.compute_senses_numpy):
+                metadata, _ = compute(data)
+                self.assertEqual(json.loads(metadata), expected)
+
+
+class TestComputeSensesBatch(unittest.TestCase):
+    keys = (
+        "coherence_ratings",
+        "structural_feedback",
+        "novelty_indicators",
+        "application_successes",
+        "likability_scores",
+    )
+
+    def setUp(self):
+        self.prompts = [
+            {
+                "coherence_ratings": [0.8, 0.9, 0.7],
+                "structural_feedback": [0.85, 0.75, 0.9],
+                "novelty_indicators": [1.2, 0.5, -0.3],
+                "application_successes": [True, True, False],
+                "likability_scores": [4.5, 5.0, 3.8],
+            },
+            {
+                "coherence_ratings": [0.8, 0.9, 1e6, 0.6],
+                "structural_feedback": [0.85],
+                "novelty_indicators": [1.2, 0.5, -1e6],
+                "application_successes": [True, False],
+                "likability_scores": [],
+            },
+        ]
+
+    def stack(self, prompts):
+        batched = np.full((len(prompts), 5, 4), np.nan)
+        for b, prompt in enumerate(prompts):
+            for j, key in enumerate(self.keys):
+                batched[b, j, : len(prompt[key])] = prompt[key]
+        return batched
+
+    def test_matches_compute_senses(self):
+        result = compute_senses_batch(self.stack(self.prompts))
+        self.assertEqual(result.shape, (2, 6))
+        # Hand-computed scores: the second prompt drops the out-of-range coherence rating
+        # and the novelty outlier, and has no likability scores
+        expected = np.array(
+            [
+                [0.8, 2.5 / 3, (2.0 / 3) / 1.2, 2.0 / 3, (13.3 / 3 - 1) / 4],
+                [2.3 / 3, 0.85, 0.85 / 1.2, 0.5, 0.0],
+            ]
+        )
+        np.testing.assert_allclose(result[:, :5], expected, rtol=1e-12)
+        np.testing.assert_allclose(result[:, 5], expected.mean(axis=1), rtol=1e-12)
+        for row, prompt in zip(result, self.prompts):
+            self.assertAlmostEqual(row[5], compute_senses(prompt)[1], places=12)
+
+    def test_writes_into_out(self):
+        out = np.empty((2, 6))
+        self.assertIs(compute_senses_batch(self.stack(self.prompts), out=out), out)
+
+    def test_concurrent_calls(self):
+        batched = self.stack(self.prompts)
+        expected = compute_senses_batch(batched)
+        if senses._HAS_NUMBA and senses.numba.threading_layer() == "workqueue":
+            self.skipTest("the workqueue threading layer is not thread-safe")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(compute_senses_batch, [batched] * 64))
+        for result in results:
+            np.testing.assert_array_equal(result, expected)
+
+    def test_rejects_integer_out(self):
+        with self.assertRaises(RuntimeError):
+            compute_senses_batch(self.stack(self.prompts), out=np.zeros((2, 6), np.int64))
+
+    def test_invalid_successes(self):
+        batched = self.stack(self.prompts)
+        batched[0, 3, 0] = 0.5
+        with self.assertRaises(RuntimeError):
+            compute_senses_batch(batched)
+
+
+class TestRemoveOutliers(unittest.TestCase):
+    def test_single_extreme_value_removed(self):
+        # A mean/std filter cannot reject 1e6 here because it inflates the std itself
+        result = remove_outliers(np.array([1.2, 0.5, -0.3, 1e6]))
+        np.testing.assert_array_equal(result, [1.2, 0.5, -0.3])
+
+    def test_zero_mad_keeps_data(self):
+        data = np.array([0.5, 0.5, 0.5, 0.9])
+        np.testing.assert_array_equal(remove_outliers(data), data)
+
+    def test_no_outliers_returns_input(self):
+        data = np.array([0.8, 0.9, 0.7, 0.85])
+        self.assertIs(remove_outliers(data), data)
+        with mock.patch.object(senses, "_filter_outliers", senses._filter_outliers_numpy):
+            self.assertIs(remove_outliers(data), data)
+
+    def test_numpy_fallback_matches(self):
+        inf = float("inf")
+        for data in (
+            np.array([0.8, 0.9, 0.7, 0.85, 1e6, -3.0]),
+            np.array([inf, inf, 1.0]),
+            np.array([inf, inf]),
+        ):
+            expected = remove_outliers(data)
+            with mock.patch.object(senses, "_filter_outliers", senses._filter_outliers_numpy):
+                np.testing.assert_array_equal(remove_outliers(data), expected)
+
+
+class TestKernelHelpers(unittest.TestCase):
+    def test_nan_median_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for size in (1, 2, 16, 17, 40, 41):
+            data = rng.normal(size=size + 3)
+            data[:3] = np.nan
+            self.assertAlmostEqual(senses._nan_median(data, size), np.nanmedian(data))
+
+    def test_filter_mean_normalizes(self):
+        likability = np.array([4.5, 5.0, 3.8, 7.0, np.nan])
+        self.assertAlmostEqual(senses._filter_mean(likability, 1.0, 5.0, 3.5), 0.858, places=3)
+        novelty = np.array([1.2, 0.5, -0.3, np.nan])
+        self.assertAlmostEqual(senses._filter_mean(novelty, -np.inf, np.inf, 3.5), 0.556, places=3)
+        self.assertEqual(senses._filter_mean(np.full(3, np.nan), 0.0, 1.0, 3.5), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()